@@ -9,18 +9,28 @@ Required environment variables:
     - NEO4J_USERNAME: The username for database authentication
     - NEO4J_PASSWORD: The password for database authentication
     - NEO4J_DATABASE: The name of the database to connect to (defaults to "neo4j")
+
+Optional driver tuning variables:
+    - NEO4J_MAX_POOL_SIZE: Maximum number of pooled connections (defaults to 50)
+    - NEO4J_CONNECTION_ACQUISITION_TIMEOUT: Seconds to wait for a pooled connection (defaults to 30)
+    - NEO4J_MAX_CONNECTION_LIFETIME: Seconds before a pooled connection is recycled (defaults to 1800)
+    - NEO4J_KEEP_ALIVE: Enable TCP keep-alive on connections (defaults to True)
+    - NEO4J_CONNECTION_TIMEOUT: Seconds to wait when opening a connection (defaults to 5)
+    - NEO4J_POOL_WARMUP: Connections opened at startup to prefill the pool (defaults to 4)
+    - NEO4J_STARTUP_INDEXES: JSON list of idempotent index statements run at startup
+      (e.g. '["CREATE INDEX entity_id_idx IF NOT EXISTS FOR (n:Entity) ON (n.id)"]')
+    - HEALTHCHECK_TTL_SEC: Seconds a connectivity check result is reused (defaults to 2)
+    - CORS_ORIGINS: JSON list of origins allowed to make cross-origin requests
+      (e.g. '["https://app.example.com"]', defaults to '["http://localhost:8000"]')
 """
 
 from pydantic_settings import BaseSettings
 from pydantic import ConfigDict
-from typing import Optional
+from functools import lru_cache
+from typing import List, Optional, Tuple
 import logging
 
 # Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
 logger = logging.getLogger(__name__)
 
 
@@ -36,6 +46,15 @@ class Neo4jSettings(BaseSettings):
         NEO4J_USERNAME (str): The username for database authentication
         NEO4J_PASSWORD (str): The password for database authentication
         NEO4J_DATABASE (str): The name of the database to connect to (defaults to "neo4j")
+        NEO4J_MAX_POOL_SIZE (int): Maximum number of pooled connections
+        NEO4J_CONNECTION_ACQUISITION_TIMEOUT (float): Seconds to wait for a pooled connection
+        NEO4J_MAX_CONNECTION_LIFETIME (float): Seconds before a pooled connection is recycled
+        NEO4J_KEEP_ALIVE (bool): Enable TCP keep-alive on connections
+        NEO4J_CONNECTION_TIMEOUT (float): Seconds to wait when opening a connection
+        NEO4J_POOL_WARMUP (int): Connections opened at startup to prefill the pool
+        NEO4J_STARTUP_INDEXES (List[str]): Index statements run at application startup
+        HEALTHCHECK_TTL_SEC (float): Seconds a connectivity check result is reused
+        CORS_ORIGINS (Tuple[str, ...]): Origins allowed to make cross-origin requests
     """
     model_config = ConfigDict(
         env_file=".env",
@@ -46,6 +65,25 @@ class Neo4jSettings(BaseSettings):
     NEO4J_USERNAME: str
     NEO4J_PASSWORD: str
     NEO4J_DATABASE: str = "neo4j"  # Default database name
+    
+    # Driver connection pool tuning
+    NEO4J_MAX_POOL_SIZE: int = 50
+    NEO4J_CONNECTION_ACQUISITION_TIMEOUT: float = 30.0
+    NEO4J_MAX_CONNECTION_LIFETIME: float = 1800.0
+    NEO4J_KEEP_ALIVE: bool = True
+    NEO4J_CONNECTION_TIMEOUT: float = 5.0
+    NEO4J_POOL_WARMUP: int = 4
+    
+    # Schema indexes created at startup; each statement must be idempotent
+    # ("CREATE INDEX ... IF NOT EXISTS")
+    NEO4J_STARTUP_INDEXES: List[str] = []
+    
+    # Connectivity check caching
+    HEALTHCHECK_TTL_SEC: float = 2.0
+    
+    # Exact origins allowed by CORS; "*" is deliberately not the default so
+    # only listed origins can call the API from a browser
+    CORS_ORIGINS: Tuple[str, ...] = ("http://localhost:8000",)
 
     def __init__(self, **kwargs):
         """
@@ -58,5 +96,17 @@ class Neo4jSettings(BaseSettings):
         logger.info("Neo4j settings loaded from environment variables")
 
 
-# Create global settings instance
-neo4j_settings = Neo4jSettings() 
\ No newline at end of file
+@lru_cache(maxsize=1)
+def get_settings() -> Neo4jSettings:
+    """
+    Return the Neo4j settings, loading them on first call.
+    
+    The settings are cached so the environment and ".env" file are read and
+    validated only once. The driver, lifespan and CORS setup call this
+    function directly, so tests override settings by setting environment
+    variables and calling ``get_settings.cache_clear()``.
+    
+    Returns:
+        Neo4jSettings: The application settings
+    """
+    return Neo4jSettings() 
\ No newline at end of file
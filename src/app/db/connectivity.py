@@ -2,84 +2,87 @@
 Neo4j database connectivity verification module.
 
 This module provides functionality to verify connectivity to the Neo4j database.
-It handles various connection scenarios and provides appropriate error messages.
+It handles various connection scenarios and raises the application's typed
+exceptions, which are turned into HTTP responses by the global handlers.
 
 Error Handling:
-    - ServiceUnavailable: When the database service is not accessible
-    - SessionExpired: When the database session has expired
-    - General exceptions: For unexpected errors during connection verification
+    - ServiceUnavailable: Raised as ServiceUnavailableError (503)
+    - SessionExpired: Raised as ServiceUnavailableError (503)
+    - AuthError: Raised as DatabaseError (500)
+    - ConfigurationError: Raised as DatabaseError (500)
+    - Other exceptions propagate to the application's global handler
 
 Example:
-    >>> status, message = verify_connection()
-    >>> if status:
+    >>> try:
+    ...     response = await verify_connection()
     ...     print("Successfully connected to database")
-    ... else:
-    ...     print(f"Connection failed: {message}")
+    ... except BaseAPIException as e:
+    ...     print(f"Connection failed: {e.detail}")
 """
 
 import logging
-from typing import Tuple
 
-from neo4j import GraphDatabase, Driver
-from neo4j.exceptions import ServiceUnavailable, SessionExpired
+from neo4j.exceptions import (
+    AuthError,
+    ConfigurationError,
+    ServiceUnavailable,
+    SessionExpired,
+)
 
-from app.core.config import neo4j_settings
+from app.db.neo4j_utils import Neo4jConnection
+from app.exceptions import DatabaseError, ServiceUnavailableError
+from app.models.connectivity import ConnectivityResponse
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
 
-def verify_connection() -> Tuple[bool, str]:
+async def verify_connection() -> ConnectivityResponse:
     """
     Verify connectivity to the Neo4j database.
     
-    This function attempts to establish a connection to the Neo4j database using
-    the configured settings. It handles various error scenarios and provides
-    appropriate status messages.
+    This function verifies the connection of the shared Neo4j driver, creating
+    it from the configured settings on first use.
     
     Returns:
-        Tuple[bool, str]: A tuple containing:
-            - bool: True if connection is successful, False otherwise
-            - str: Status message describing the result
+        ConnectivityResponse: Successful connection status and message
+        
+    Raises:
+        ServiceUnavailableError: If the database service is unavailable or
+            the session expired
+        DatabaseError: If authentication fails or the driver is misconfigured
             
     Example:
-        >>> status, message = verify_connection()
-        >>> if status:
-        ...     print("Successfully connected to database")
-        ... else:
-        ...     print(f"Connection failed: {message}")
+        >>> response = await verify_connection()
+        >>> print(response.message)
+        Successfully connected to Neo4j database
     """
     logger.info("Attempting to verify Neo4j database connectivity")
     
     try:
-        # Create a driver instance
-        driver: Driver = GraphDatabase.driver(
-            neo4j_settings.NEO4J_URI,
-            auth=(neo4j_settings.NEO4J_USERNAME, neo4j_settings.NEO4J_PASSWORD)
-        )
-        
-        # Try to connect and verify the connection
-        driver.verify_connectivity()
-        
-        # If we get here, connection was successful
-        logger.info("Successfully verified Neo4j database connectivity")
-        return True, "Successfully connected to Neo4j database"
+        # Reuse the shared driver and verify the connection
+        await Neo4jConnection.get_driver().verify_connectivity()
         
     except ServiceUnavailable as e:
-        logger.error(f"Failed to connect to Neo4j database: {str(e)}")
-        return False, "Database service is unavailable"
+        logger.error("Failed to connect to Neo4j database: %s", e)
+        raise ServiceUnavailableError("Database service is unavailable") from e
         
     except SessionExpired as e:
-        logger.error(f"Neo4j session expired: {str(e)}")
-        return False, "Database session expired"
+        logger.error("Neo4j session expired: %s", e)
+        raise ServiceUnavailableError("Database session expired") from e
         
-    except Exception as e:
-        logger.error(f"Unexpected error while verifying Neo4j connectivity: {str(e)}")
-        return False, f"Connection failed: {str(e)}"
+    except AuthError as e:
+        logger.error("Neo4j authentication failed: %s", e)
+        raise DatabaseError("Database authentication failed") from e
         
-    finally:
-        # Always close the driver
-        try:
-            driver.close()
-        except Exception as e:
-            logger.warning(f"Error while closing Neo4j driver: {str(e)}") 
\ No newline at end of file
+    except ConfigurationError as e:
+        logger.error("Invalid Neo4j driver configuration: %s", e)
+        raise DatabaseError("Database configuration error") from e
+    
+    # If we get here, connection was successful; the values are trusted, so
+    # skip validation
+    logger.info("Successfully verified Neo4j database connectivity")
+    return ConnectivityResponse.model_construct(
+        status=True,
+        message="Successfully connected to Neo4j database"
+    )
\ No newline at end of file
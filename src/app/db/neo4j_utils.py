@@ -2,71 +2,205 @@
 Neo4j database utilities and connection management.
 """
 
+import asyncio
 import logging
-from typing import Any, Dict, Optional, Generator
+from contextlib import suppress
+from typing import Any, AsyncIterator, Dict, List, Optional, Union
 
-from fastapi import Depends
-from neo4j import GraphDatabase, Driver, Session, Transaction
+from fastapi import Depends, Request
+from neo4j import (
+    AsyncGraphDatabase,
+    AsyncDriver,
+    AsyncManagedTransaction,
+    AsyncSession,
+    AsyncTransaction,
+    Record,
+    ResultSummary,
+)
 
-from app.core.config import neo4j_settings
+from app.core.config import Neo4jSettings, get_settings
 
 # Configure logging
 logger: logging.Logger = logging.getLogger(__name__)
 
 
-def get_neo4j_driver() -> Generator[Driver, None, None]:
+class Neo4jConnection:
     """
-    Create and yield a Neo4j driver instance.
+    Process-wide holder for the shared Neo4j driver.
     
-    Yields:
-        Driver: Neo4j driver instance
+    The driver owns a pool of Bolt connections and is safe to share between
+    requests, so it is created once on first use and reused until shutdown.
+    """
+    _driver: Optional[AsyncDriver] = None
+
+    @classmethod
+    def get_driver(cls) -> AsyncDriver:
+        """
+        Return the shared Neo4j driver, creating it on first call.
+        
+        Returns:
+            AsyncDriver: Neo4j driver instance
+            
+        Note:
+            Creating the driver does not open any connection; use
+            ``await driver.verify_connectivity()`` to check the database.
+        """
+        if cls._driver is None:
+            settings: Neo4jSettings = get_settings()
+            logger.debug("Creating Neo4j driver with URI: %s", settings.NEO4J_URI)
+            cls._driver = AsyncGraphDatabase.driver(
+                settings.NEO4J_URI,
+                auth=(settings.NEO4J_USERNAME, settings.NEO4J_PASSWORD),
+                max_connection_pool_size=settings.NEO4J_MAX_POOL_SIZE,
+                connection_acquisition_timeout=settings.NEO4J_CONNECTION_ACQUISITION_TIMEOUT,
+                max_connection_lifetime=settings.NEO4J_MAX_CONNECTION_LIFETIME,
+                keep_alive=settings.NEO4J_KEEP_ALIVE,
+                connection_timeout=settings.NEO4J_CONNECTION_TIMEOUT
+            )
+        return cls._driver
+
+    @classmethod
+    async def close_driver(cls) -> None:
+        """
+        Close the shared Neo4j driver and release its connection pool.
+        """
+        if cls._driver is not None:
+            logger.debug("Closing Neo4j driver")
+            await cls._driver.close()
+            cls._driver = None
+
+
+def get_neo4j_driver(request: Request) -> AsyncDriver:
+    """
+    Return the Neo4j driver created by the application lifespan.
+    
+    Args:
+        request: The incoming request
+        
+    Returns:
+        AsyncDriver: Neo4j driver instance
         
     Note:
-        The driver is automatically closed when the generator is exhausted.
+        The driver is shared across requests and is closed on application
+        shutdown, not per request.
     """
-    logger.debug(f"Creating Neo4j driver with URI: {neo4j_settings.NEO4J_URI}")
-    driver: Driver = GraphDatabase.driver(
-        neo4j_settings.NEO4J_URI,
-        auth=(neo4j_settings.NEO4J_USERNAME, neo4j_settings.NEO4J_PASSWORD)
-    )
-    try:
-        yield driver
-    finally:
-        driver.close()
+    return request.app.state.neo4j_driver
 
 
 # Type alias for dependency injection
 Neo4jDriverDependency = Depends(get_neo4j_driver)
 
 
-def get_neo4j_session(driver: Driver = Neo4jDriverDependency) -> Generator[Session, None, None]:
+async def get_neo4j_session(
+    request: Request,
+    driver: AsyncDriver = Neo4jDriverDependency,
+    settings: Neo4jSettings = Depends(get_settings)
+) -> AsyncIterator[AsyncSession]:
     """
-    Create and yield a Neo4j session instance.
+    Yield the Neo4j session scoped to the current request.
+    
+    The session is opened on first use and cached on ``request.state`` so
+    sequential queries issued while handling one request share it.
     
     Args:
+        request: The incoming request
         driver: Neo4j driver instance
+        settings: Application settings
         
     Yields:
-        Session: Neo4j session instance
+        AsyncSession: Neo4j session instance
         
     Note:
-        The session is automatically closed when the generator is exhausted.
+        The session is closed by the dependency that opened it once the
+        request has been handled. A session runs one query at a time, so
+        endpoints that query in parallel or stream results should open their
+        own sessions from the driver instead.
     """
-    session: Session = driver.session(database=neo4j_settings.NEO4J_DATABASE)
+    session: Optional[AsyncSession] = getattr(request.state, "neo4j_session", None)
+    if session is not None:
+        yield session
+        return
+    
+    session = driver.session(database=settings.NEO4J_DATABASE)
+    request.state.neo4j_session = session
     try:
         yield session
     finally:
-        session.close()
+        del request.state.neo4j_session
+        await session.close()
+
+
+async def create_indexes(
+    driver: AsyncDriver,
+    statements: List[str],
+    database: Optional[str] = None
+) -> None:
+    """
+    Create schema indexes so that property lookups avoid full label scans.
+    
+    Args:
+        driver: Neo4j driver instance
+        statements: Index creation statements, e.g.
+            "CREATE INDEX entity_id_idx IF NOT EXISTS FOR (n:Entity) ON (n.id)"
+        database: Name of the database to create the indexes in
+        
+    Note:
+        Statements should use "IF NOT EXISTS" so they are safe to run on
+        every startup.
+    """
+    if not statements:
+        return
+    
+    async with driver.session(database=database) as session:
+        for statement in statements:
+            logger.info("Ensuring Neo4j index: %s", statement)
+            result = await session.run(statement)
+            await result.consume()
+
+
+async def _warmup_connection(driver: AsyncDriver, database: Optional[str]) -> None:
+    """
+    Run a trivial query so the driver opens and pools a connection.
+    """
+    async with driver.session(database=database) as session:
+        result = await session.run("RETURN 1")
+        await result.consume()
+
+
+async def warmup_pool(
+    driver: AsyncDriver,
+    size: int,
+    database: Optional[str] = None
+) -> None:
+    """
+    Prefill the driver's connection pool before serving requests.
+    
+    The queries run concurrently so each holds its own connection, moving the
+    TCP/TLS/Bolt handshake cost off the first user requests.
+    
+    Args:
+        driver: Neo4j driver instance
+        size: Number of connections to open
+        database: Name of the database to run the warmup queries against
+    """
+    if size < 1:
+        return
+    
+    logger.info("Warming up Neo4j connection pool with %d connections", size)
+    await asyncio.gather(*(_warmup_connection(driver, database) for _ in range(size)))
 
 
-def execute_query(
-    tx: Transaction,
+async def execute_query(
+    tx: AsyncTransaction,
     query: str,
     params: Optional[Dict[str, Any]] = None
 ) -> Any:
     """
     Execute a parameterized Cypher query within a transaction.
     
+    Deprecated: prefer ``run_read`` / ``run_write``, which run the query in a
+    managed transaction that is retried on transient errors.
+    
     Args:
         tx: Neo4j transaction instance
         query: Cypher query string
@@ -81,6 +215,245 @@ def execute_query(
     if params is None:
         params = {}
     
-    logger.debug(f"Executing query: {query} with params: {params}")
-    result = tx.run(query, params)
-    return result 
\ No newline at end of file
+    logger.debug("Executing query: %s with params: %s", query, params)
+    result = await tx.run(query, params)
+    return result
+
+
+async def _collect_records(
+    tx: AsyncManagedTransaction,
+    query: str,
+    params: Dict[str, Any]
+) -> List[Record]:
+    """
+    Run a query and collect its records inside a managed transaction.
+    
+    Records must be consumed before the transaction function returns, so
+    they are materialized here rather than returning the lazy result.
+    """
+    logger.debug("Executing query: %s with params: %s", query, params)
+    result = await tx.run(query, params)
+    return [record async for record in result]
+
+
+async def run_read(
+    session: AsyncSession,
+    query: str,
+    params: Optional[Dict[str, Any]] = None
+) -> List[Record]:
+    """
+    Execute a read query in a managed transaction with automatic retries.
+    
+    Transient failures such as ``SessionExpired`` or ``ServiceUnavailable``
+    are retried by the driver with exponential backoff, and in a cluster the
+    query is routed to a reader.
+    
+    Args:
+        session: Neo4j session instance
+        query: Cypher query string
+        params: Query parameters
+        
+    Returns:
+        List[Record]: Query records
+    """
+    return await session.execute_read(_collect_records, query, params or {})
+
+
+async def run_write(
+    session: AsyncSession,
+    query: str,
+    params: Optional[Dict[str, Any]] = None
+) -> List[Record]:
+    """
+    Execute a write query in a managed transaction with automatic retries.
+    
+    Transient failures such as ``SessionExpired`` or ``ServiceUnavailable``
+    are retried by the driver with exponential backoff. The query may be
+    executed more than once, so it should be idempotent (e.g. use ``MERGE``).
+    
+    Args:
+        session: Neo4j session instance
+        query: Cypher query string
+        params: Query parameters
+        
+    Returns:
+        List[Record]: Query records
+    """
+    return await session.execute_write(_collect_records, query, params or {})
+
+
+async def execute_batch(
+    tx: AsyncTransaction,
+    query: str,
+    rows: List[Dict[str, Any]],
+    chunk_size: int = 1000
+) -> List[ResultSummary]:
+    """
+    Execute a Cypher query once per chunk of rows using ``UNWIND``.
+    
+    Sending the rows as a single list parameter lets the server process many
+    records in one round trip instead of one ``tx.run`` call per row.
+    
+    Args:
+        tx: Neo4j transaction instance
+        query: Cypher query reading the rows from the ``$rows`` parameter, e.g.
+            "UNWIND $rows AS r MERGE (n:Entity {id: r.id}) SET n += r.props"
+        rows: Parameter maps, one per record
+        chunk_size: Maximum number of rows sent per query
+        
+    Returns:
+        List[ResultSummary]: Summary of each executed chunk
+        
+    Note:
+        To match pairs of nodes, unwind the pairs instead of filtering with
+        ``IN`` lists, which produces a Cartesian product:
+        "UNWIND $rows AS e MATCH (s:Entity {id: e.s}), (t:Entity {id: e.t}) ..."
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be a positive integer")
+    
+    logger.debug("Executing batch query: %s with %d rows", query, len(rows))
+    summaries: List[ResultSummary] = []
+    for start in range(0, len(rows), chunk_size):
+        result = await tx.run(query, rows=rows[start:start + chunk_size])
+        summaries.append(await result.consume())
+    return summaries
+
+
+async def _fetch_page(
+    session: AsyncSession,
+    query: str,
+    params: Dict[str, Any],
+    skip: int,
+    limit: int
+) -> List[Record]:
+    """
+    Fetch one page of records by appending ``SKIP``/``LIMIT`` to a query.
+    
+    Args:
+        session: Neo4j session instance
+        query: Cypher query string without ``SKIP``/``LIMIT``
+        params: Query parameters
+        skip: Number of records to skip
+        limit: Maximum number of records to return
+        
+    Returns:
+        List[Record]: Records of the requested page
+    """
+    paged_query = f"{query} SKIP $_skip LIMIT $_limit"
+    result = await session.run(paged_query, {**params, "_skip": skip, "_limit": limit})
+    return [record async for record in result]
+
+
+async def execute_query_paged(
+    session: AsyncSession,
+    query: str,
+    params: Optional[Dict[str, Any]] = None,
+    page_size: int = 1000
+) -> AsyncIterator[Record]:
+    """
+    Execute a Cypher query page by page and yield its records lazily.
+    
+    Only one page is held in memory at a time, so large result sets can be
+    processed without materializing them with ``.data()``.
+    
+    Args:
+        session: Neo4j session instance
+        query: Cypher query string without ``SKIP``/``LIMIT``; it should end
+            with an ``ORDER BY`` clause so pages are stable
+        params: Query parameters
+        page_size: Number of records fetched per query
+        
+    Yields:
+        Record: Query records in order
+        
+    Example:
+        >>> async for record in execute_query_paged(
+        ...     session, "MATCH (n:Entity) RETURN n ORDER BY n.id"
+        ... ):
+        ...     print(record["n"])
+    """
+    if page_size < 1:
+        raise ValueError("page_size must be a positive integer")
+    if params is None:
+        params = {}
+    
+    skip = 0
+    while True:
+        records = await _fetch_page(session, query, params, skip, page_size)
+        for record in records:
+            yield record
+        if len(records) < page_size:
+            break
+        skip += page_size
+
+
+async def prefetch_pages(
+    session: AsyncSession,
+    query: str,
+    params: Optional[Dict[str, Any]] = None,
+    page_size: int = 1000,
+    prefetch: int = 2
+) -> AsyncIterator[List[Record]]:
+    """
+    Execute a Cypher query page by page, fetching ahead of the consumer.
+    
+    A background task keeps up to ``prefetch`` pages buffered while the
+    caller processes the current one, so the connection is not left idle
+    between pages.
+    
+    Args:
+        session: Neo4j session instance; it must not be used by the caller
+            until iteration is finished
+        query: Cypher query string without ``SKIP``/``LIMIT``; it should end
+            with an ``ORDER BY`` clause so pages are stable
+        params: Query parameters
+        page_size: Number of records fetched per query
+        prefetch: Maximum number of pages buffered ahead of the consumer
+        
+    Yields:
+        List[Record]: Non-empty pages of records in order
+        
+    Example:
+        >>> async for page in prefetch_pages(
+        ...     session, "MATCH (n:Entity) RETURN n ORDER BY n.id"
+        ... ):
+        ...     process(page)
+    """
+    if page_size < 1:
+        raise ValueError("page_size must be a positive integer")
+    if prefetch < 1:
+        raise ValueError("prefetch must be a positive integer")
+    if params is None:
+        params = {}
+    
+    queue: "asyncio.Queue[Union[List[Record], Exception, None]]" = asyncio.Queue(maxsize=prefetch)
+
+    async def produce() -> None:
+        skip = 0
+        try:
+            while True:
+                records = await _fetch_page(session, query, params, skip, page_size)
+                if records:
+                    await queue.put(records)
+                if len(records) < page_size:
+                    break
+                skip += page_size
+        except Exception as e:
+            await queue.put(e)
+            return
+        await queue.put(None)
+
+    producer = asyncio.create_task(produce())
+    try:
+        while True:
+            page = await queue.get()
+            if page is None:
+                break
+            if isinstance(page, Exception):
+                raise page
+            yield page
+    finally:
+        producer.cancel()
+        with suppress(asyncio.CancelledError):
+            await producer
\ No newline at end of file
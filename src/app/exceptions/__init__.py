@@ -5,6 +5,7 @@ Expose custom exceptions for use throughout the application.
 from .base import (
     BaseAPIException,
     DatabaseError,
+    ServiceUnavailableError,
     ValidationError,
     AuthenticationError,
     ResourceNotFoundError,
@@ -13,6 +14,7 @@ from .base import (
 __all__ = [
     "BaseAPIException",
     "DatabaseError",
+    "ServiceUnavailableError",
     "ValidationError",
     "AuthenticationError",
     "ResourceNotFoundError",
@@ -35,6 +35,21 @@ class DatabaseError(BaseAPIException):
         )
 
 
+class ServiceUnavailableError(BaseAPIException):
+    """Exception raised when a backing service is temporarily unavailable."""
+    
+    def __init__(
+        self,
+        detail: str = "Service unavailable",
+        headers: Optional[Dict[str, str]] = None
+    ) -> None:
+        super().__init__(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=detail,
+            headers=headers
+        )
+
+
 class ValidationError(BaseAPIException):
     """Exception raised for validation errors."""
     
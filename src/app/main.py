@@ -5,11 +5,14 @@ and middleware.
 """
 
 import logging
-from typing import Any, Dict, Optional
+import logging.config
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Optional
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.exceptions import RequestValidationError
 from pydantic import ValidationError
 
@@ -20,15 +23,85 @@ from .exceptions import (
     AuthenticationError,
     ResourceNotFoundError,
 )
+from .core.config import get_settings
+from .db.neo4j_utils import (
+    Neo4jConnection,
+    create_indexes,
+    warmup_pool,
+)
 from .routes.connectivity import router as connectivity_router
 
 # Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+LOGGING_CONFIG: Dict[str, Any] = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "formatters": {
+        "default": {
+            "format": "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+        }
+    },
+    "handlers": {
+        "console": {
+            "class": "logging.StreamHandler",
+            "formatter": "default"
+        }
+    },
+    "root": {
+        "level": "INFO",
+        "handlers": ["console"]
+    }
+}
 logger: logging.Logger = logging.getLogger(__name__)
 
+def configure_logging() -> None:
+    """
+    Apply LOGGING_CONFIG unless logging has already been configured.
+    
+    Runs before the settings are loaded so their startup messages are not
+    dropped, and leaves an existing root configuration (e.g. passed with
+    uvicorn's ``--log-config``) untouched.
+    """
+    if logging.getLogger().handlers:
+        return
+    logging.config.dictConfig(LOGGING_CONFIG)
+
+# Configure logging before the settings are loaded below
+configure_logging()
+
+# Application lifespan
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """
+    Manage the Neo4j driver for the lifetime of the application.
+    
+    The driver is created once at startup and stored on ``app.state`` so
+    request handlers share a single connection pool, then closed at shutdown.
+    Configured schema indexes are ensured and the pool is prefilled before
+    the first request is served.
+    
+    Args:
+        app: The FastAPI application instance
+    """
+    logger.info("Initializing Neo4j driver")
+    app.state.neo4j_driver = Neo4jConnection.get_driver()
+    try:
+        await app.state.neo4j_driver.verify_connectivity()
+        settings = get_settings()
+        await create_indexes(
+            app.state.neo4j_driver,
+            settings.NEO4J_STARTUP_INDEXES,
+            database=settings.NEO4J_DATABASE
+        )
+        await warmup_pool(
+            app.state.neo4j_driver,
+            min(settings.NEO4J_POOL_WARMUP, settings.NEO4J_MAX_POOL_SIZE),
+            database=settings.NEO4J_DATABASE
+        )
+        yield
+    finally:
+        logger.info("Closing Neo4j driver")
+        await Neo4jConnection.close_driver()
+
 # Initialize FastAPI application
 app: FastAPI = FastAPI(
     title="Neo4j DB API",
@@ -36,16 +109,22 @@ app: FastAPI = FastAPI(
     version="1.0.0",
     docs_url="/api/docs",
     redoc_url="/api/redoc",
-    openapi_url="/api/openapi.json"
+    openapi_url="/api/openapi.json",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
+# Compress larger responses; added before CORS so CORS wraps it and still
+# sets its headers on compressed responses
+app.add_middleware(GZipMiddleware, minimum_size=500)
+
 # Configure CORS middleware
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # In production, replace with specific origins
+    allow_origins=tuple(get_settings().CORS_ORIGINS),
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=("GET", "POST", "PUT", "DELETE"),
+    allow_headers=("Authorization", "Content-Type"),
     max_age=3600,
 )
 
@@ -62,9 +141,10 @@ async def log_requests(request: Request, call_next: Any) -> Any:
     Returns:
         The response from the next handler
     """
-    logger.info(f"Incoming request: {request.method} {request.url}")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Incoming request: %s %s", request.method, request.url)
     response: Any = await call_next(request)
-    logger.info(f"Response status: {response.status_code}")
+    logger.info("Response status: %s", response.status_code)
     return response
 
 # Global exception handlers
@@ -72,7 +152,7 @@ async def log_requests(request: Request, call_next: Any) -> Any:
 async def base_api_exception_handler(
     request: Request,
     exc: BaseAPIException
-) -> JSONResponse:
+) -> ORJSONResponse:
     """
     Handle all custom API exceptions.
     
@@ -81,10 +161,10 @@ async def base_api_exception_handler(
         exc: The exception that was raised
         
     Returns:
-        JSONResponse with error details
+        ORJSONResponse with error details
     """
-    logger.error(f"API Exception: {exc.detail}")
-    return JSONResponse(
+    logger.error("API Exception: %s", exc.detail)
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={"detail": exc.detail},
         headers=exc.headers
@@ -94,7 +174,7 @@ async def base_api_exception_handler(
 async def validation_exception_handler(
     request: Request,
     exc: RequestValidationError
-) -> JSONResponse:
+) -> ORJSONResponse:
     """
     Handle FastAPI validation errors.
     
@@ -103,10 +183,10 @@ async def validation_exception_handler(
         exc: The validation error that was raised
         
     Returns:
-        JSONResponse with validation error details
+        ORJSONResponse with validation error details
     """
-    logger.error(f"Validation Error: {exc.errors()}")
-    return JSONResponse(
+    logger.error("Validation Error: %s", exc.errors())
+    return ORJSONResponse(
         status_code=422,
         content={"detail": exc.errors()}
     )
@@ -115,7 +195,7 @@ async def validation_exception_handler(
 async def pydantic_validation_exception_handler(
     request: Request,
     exc: ValidationError
-) -> JSONResponse:
+) -> ORJSONResponse:
     """
     Handle Pydantic validation errors.
     
@@ -124,10 +204,10 @@ async def pydantic_validation_exception_handler(
         exc: The Pydantic validation error that was raised
         
     Returns:
-        JSONResponse with validation error details
+        ORJSONResponse with validation error details
     """
-    logger.error(f"Pydantic Validation Error: {exc.errors()}")
-    return JSONResponse(
+    logger.error("Pydantic Validation Error: %s", exc.errors())
+    return ORJSONResponse(
         status_code=422,
         content={"detail": exc.errors()}
     )
@@ -136,7 +216,7 @@ async def pydantic_validation_exception_handler(
 async def general_exception_handler(
     request: Request,
     exc: Exception
-) -> JSONResponse:
+) -> ORJSONResponse:
     """
     Handle all other exceptions.
     
@@ -145,24 +225,24 @@ async def general_exception_handler(
         exc: The exception that was raised
         
     Returns:
-        JSONResponse with generic error message
+        ORJSONResponse with generic error message
     """
-    logger.error(f"Unexpected error: {str(exc)}", exc_info=True)
-    return JSONResponse(
+    logger.error("Unexpected error: %s", exc, exc_info=True)
+    return ORJSONResponse(
         status_code=500,
         content={"detail": "Internal server error"}
     )
 
 # Health check endpoint
 @app.get("/health")
-async def health_check() -> JSONResponse:
+async def health_check() -> ORJSONResponse:
     """
     Basic health check endpoint.
     
     Returns:
-        JSONResponse with status information
+        ORJSONResponse with status information
     """
-    return JSONResponse(
+    return ORJSONResponse(
         content={"status": "healthy"},
         status_code=200
     )
@@ -174,10 +254,19 @@ API_V1_PREFIX: str = "/api/v1"
 app.include_router(connectivity_router, prefix=API_V1_PREFIX)
 
 if __name__ == "__main__":
+    # Production entry point: several worker processes without auto-reload,
+    # which would force a single process polling for file changes. For
+    # development use `uvicorn app.main:app --app-dir src --reload` instead.
+    # To import the app once before forking workers, run it under gunicorn:
+    #   gunicorn app.main:app --chdir src --preload \
+    #       -k uvicorn.workers.UvicornWorker -w 4
+    # The Neo4j driver is created in the lifespan, i.e. in each worker after
+    # the fork, so its connections are never shared between processes.
+    import os
     import uvicorn
     uvicorn.run(
-        "main:app",
+        "app.main:app",
         host="0.0.0.0",
         port=8000,
-        reload=True  # Enable auto-reload during development
+        workers=int(os.environ.get("WEB_CONCURRENCY", "1"))
     ) 
\ No newline at end of file
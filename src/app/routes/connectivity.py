@@ -7,7 +7,8 @@ Neo4j database.
 
 Endpoints:
     GET /verify-connectivity
-        Verifies connectivity to the Neo4j database.
+        Verifies connectivity to the Neo4j database. The result is reused for
+        HEALTHCHECK_TTL_SEC seconds so frequent health probes share one check.
         
         Returns:
             200: Successfully connected to database
@@ -21,15 +22,49 @@ Endpoints:
             }
 """
 
+import asyncio
 import logging
-from fastapi import APIRouter, HTTPException
+import time
+from typing import Any, Dict, Optional, Tuple, Union
 
+from fastapi import APIRouter, Depends
+from fastapi.responses import ORJSONResponse
+
+from app.core.config import Neo4jSettings, get_settings
 from app.db.connectivity import verify_connection
+from app.exceptions import BaseAPIException
 from app.models.connectivity import ConnectivityResponse
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Failed check as (status code, detail, headers), replayed as a new exception
+CachedError = Tuple[int, Any, Optional[Dict[str, str]]]
+
+# Outcome of the last connectivity check as (monotonic time, response or error)
+_last_check: Optional[Tuple[float, Union[ConnectivityResponse, CachedError]]] = None
+# Lock serializing checks, with the event loop it was created for
+_check_lock: Optional[Tuple[asyncio.AbstractEventLoop, asyncio.Lock]] = None
+
+
+def _get_check_lock() -> asyncio.Lock:
+    """
+    Return the check lock for the running event loop.
+    
+    A lock bound to a previous event loop cannot be awaited from a new one,
+    so the lock is recreated whenever the running loop changes.
+    
+    Returns:
+        asyncio.Lock: Lock serializing connectivity checks
+    """
+    global _check_lock
+    
+    loop = asyncio.get_running_loop()
+    if _check_lock is None or _check_lock[0] is not loop:
+        _check_lock = (loop, asyncio.Lock())
+    return _check_lock[1]
+
+
 # Create router
 router = APIRouter(
     prefix="/verify-connectivity",
@@ -42,27 +77,69 @@ router = APIRouter(
 )
 
 
+async def _cached_verify_connection(ttl: float) -> ConnectivityResponse:
+    """
+    Verify connectivity, reusing the last outcome if it is fresher than ``ttl``.
+    
+    Concurrent callers wait on a lock, so a burst of requests results in a
+    single database check. Failures are cached as well as successes.
+    
+    Args:
+        ttl: Number of seconds a previous outcome stays valid
+        
+    Returns:
+        ConnectivityResponse: Successful connection status and message
+        
+    Raises:
+        BaseAPIException: A new exception with the status code and detail of
+            the error raised by the last connectivity check
+    """
+    global _last_check
+    
+    async with _get_check_lock():
+        if _last_check is not None and time.monotonic() - _last_check[0] < ttl:
+            outcome = _last_check[1]
+        else:
+            try:
+                outcome = await verify_connection()
+            except BaseAPIException as e:
+                outcome = (e.status_code, e.detail, e.headers)
+            _last_check = (time.monotonic(), outcome)
+    
+    if isinstance(outcome, tuple):
+        status_code, detail, headers = outcome
+        raise BaseAPIException(status_code=status_code, detail=detail, headers=headers)
+    return outcome
+
+
 @router.get(
     "",
     response_model=ConnectivityResponse,
     summary="Verify database connectivity",
     description="Checks if the application can connect to the Neo4j database."
 )
-async def check_connectivity() -> ConnectivityResponse:
+async def check_connectivity(
+    settings: Neo4jSettings = Depends(get_settings)
+) -> ORJSONResponse:
     """
     Verify connectivity to the Neo4j database.
     
     This endpoint attempts to establish a connection to the Neo4j database
     and returns the connection status. It handles various error scenarios
-    and provides appropriate HTTP status codes and error messages.
+    and provides appropriate HTTP status codes and error messages. Results
+    are cached for ``HEALTHCHECK_TTL_SEC`` seconds.
+    
+    Args:
+        settings: Application settings
     
     Returns:
-        ConnectivityResponse: Response containing connection status and message
+        ORJSONResponse: Serialized ConnectivityResponse with connection status
+        and message; returned directly so FastAPI does not validate the
+        model again against ``response_model``
         
     Raises:
-        HTTPException: 
-            - 503: If the database service is unavailable
-            - 500: If there's an unexpected error
+        ServiceUnavailableError: 503 if the database service is unavailable
+        DatabaseError: 500 if authentication fails or the driver is misconfigured
             
     Example Response:
         {
@@ -71,37 +148,5 @@ async def check_connectivity() -> ConnectivityResponse:
         }
     """
     logger.info("Received request to verify database connectivity")
-    
-    try:
-        status, message = verify_connection()
-        
-        if not status:
-            logger.error(f"Database connectivity check failed: {message}")
-            # For expected errors (like service unavailable), return 503
-            if "service is unavailable" in message.lower() or "session expired" in message.lower():
-                raise HTTPException(
-                    status_code=503,
-                    detail=message
-                )
-            # For unexpected errors, return 500
-            else:
-                raise HTTPException(
-                    status_code=500,
-                    detail="Internal server error while verifying database connectivity"
-                )
-            
-        logger.info("Database connectivity check successful")
-        return ConnectivityResponse(
-            status=status,
-            message=message
-        )
-        
-    except HTTPException:
-        raise
-        
-    except Exception as e:
-        logger.error(f"Unexpected error during connectivity check: {str(e)}")
-        raise HTTPException(
-            status_code=500,
-            detail="Internal server error while verifying database connectivity"
-        ) 
\ No newline at end of file
+    response = await _cached_verify_connection(settings.HEALTHCHECK_TTL_SEC)
+    return ORJSONResponse(response.model_dump())
\ No newline at end of file
@@ -42,4 +42,18 @@ def test_api_docs_available() -> None:
     # Test OpenAPI schema
     response = client.get("/api/openapi.json")
     assert response.status_code == 200
-    assert "openapi" in response.json() 
\ No newline at end of file
+    assert "openapi" in response.json() 
+
+
+def test_large_responses_are_compressed() -> None:
+    """
+    Test that large responses are gzip-compressed.
+    
+    Verifies that:
+    1. The OpenAPI schema is served with gzip content encoding
+    2. The decompressed body is still valid JSON
+    """
+    response = client.get("/api/openapi.json", headers={"Accept-Encoding": "gzip"})
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert "openapi" in response.json()
\ No newline at end of file
@@ -2,8 +2,16 @@
 Shared test fixtures and configuration.
 """
 
+import os
+
 import pytest
 from fastapi.testclient import TestClient
+
+# Provide connection settings so tests do not depend on a local .env file
+os.environ.setdefault("NEO4J_URI", "bolt://localhost:7687")
+os.environ.setdefault("NEO4J_USERNAME", "neo4j")
+os.environ.setdefault("NEO4J_PASSWORD", "password")
+
 from app.main import app
 
 @pytest.fixture
@@ -3,15 +3,18 @@ Tests for database connectivity verification endpoint.
 """
 
 import pytest
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 from fastapi.testclient import TestClient
-from neo4j.exceptions import ServiceUnavailable, SessionExpired
+from neo4j.exceptions import AuthError, ServiceUnavailable, SessionExpired
 
+from app.core.config import get_settings
 from app.main import app
+from app.db.neo4j_utils import Neo4jConnection
+from app.routes import connectivity as connectivity_routes
 from app.models.connectivity import ConnectivityResponse
 
-# Create test client
-client = TestClient(app)
+# Create test client; unhandled errors are returned as 500 responses
+client = TestClient(app, raise_server_exceptions=False)
 
 # Test data
 SUCCESS_RESPONSE = {
@@ -28,15 +31,21 @@ FAILURE_RESPONSE = {
 @pytest.fixture
 def mock_neo4j_driver():
     """Fixture to mock Neo4j driver."""
-    with patch("app.db.connectivity.GraphDatabase") as mock_graph_db:
+    Neo4jConnection._driver = None
+    connectivity_routes._last_check = None
+    connectivity_routes._check_lock = None
+    with patch("app.db.neo4j_utils.AsyncGraphDatabase") as mock_graph_db:
         yield mock_graph_db
+    Neo4jConnection._driver = None
+    connectivity_routes._last_check = None
+    connectivity_routes._check_lock = None
 
 
 def test_successful_connection(mock_neo4j_driver):
     """Test successful database connection verification."""
     # Mock successful connection
     mock_driver = Mock()
-    mock_driver.verify_connectivity.return_value = None
+    mock_driver.verify_connectivity = AsyncMock(return_value=None)
     mock_neo4j_driver.driver.return_value = mock_driver
     
     # Make request to endpoint
@@ -47,11 +56,91 @@ def test_successful_connection(mock_neo4j_driver):
     assert response.json() == SUCCESS_RESPONSE
 
 
+def test_driver_uses_configured_settings(mock_neo4j_driver):
+    """Test that the driver is only created from the configured settings."""
+    settings = get_settings()
+    
+    Neo4jConnection.get_driver()
+    
+    # Assert the URI and credentials come from the settings
+    mock_neo4j_driver.driver.assert_called_once()
+    args, kwargs = mock_neo4j_driver.driver.call_args
+    assert args == (settings.NEO4J_URI,)
+    assert kwargs["auth"] == (settings.NEO4J_USERNAME, settings.NEO4J_PASSWORD)
+    assert kwargs["max_connection_pool_size"] == settings.NEO4J_MAX_POOL_SIZE
+
+
+def test_driver_is_reused(mock_neo4j_driver):
+    """Test that the Neo4j driver is created once and shared across requests."""
+    mock_driver = Mock()
+    mock_driver.verify_connectivity = AsyncMock(return_value=None)
+    mock_neo4j_driver.driver.return_value = mock_driver
+    
+    # Make several requests to endpoint
+    for _ in range(3):
+        response = client.get("/api/v1/verify-connectivity")
+        assert response.status_code == 200
+    
+    # Assert driver was created once and never closed by a request
+    mock_neo4j_driver.driver.assert_called_once()
+    mock_driver.close.assert_not_called()
+
+
+def test_connectivity_result_is_cached(mock_neo4j_driver):
+    """Test that repeated checks within the TTL reuse the last result."""
+    mock_driver = Mock()
+    mock_driver.verify_connectivity = AsyncMock(return_value=None)
+    mock_neo4j_driver.driver.return_value = mock_driver
+    
+    # Make several requests to endpoint within the TTL
+    for _ in range(3):
+        response = client.get("/api/v1/verify-connectivity")
+        assert response.status_code == 200
+        assert response.json() == SUCCESS_RESPONSE
+    
+    # Assert the database was checked once
+    mock_driver.verify_connectivity.assert_awaited_once()
+
+
+def test_connectivity_error_is_cached(mock_neo4j_driver):
+    """Test that a failed check is replayed within the TTL."""
+    mock_driver = Mock()
+    mock_driver.verify_connectivity = AsyncMock(side_effect=ServiceUnavailable("Service unavailable"))
+    mock_neo4j_driver.driver.return_value = mock_driver
+    
+    # Make several requests to endpoint within the TTL
+    for _ in range(2):
+        response = client.get("/api/v1/verify-connectivity")
+        assert response.status_code == 503
+        assert response.json()["detail"] == "Database service is unavailable"
+    
+    # Assert the database was checked once
+    mock_driver.verify_connectivity.assert_awaited_once()
+
+
+def test_connectivity_cache_expires(mock_neo4j_driver):
+    """Test that a new check runs once the TTL has expired."""
+    mock_driver = Mock()
+    mock_driver.verify_connectivity = AsyncMock(return_value=None)
+    mock_neo4j_driver.driver.return_value = mock_driver
+    ttl = get_settings().HEALTHCHECK_TTL_SEC
+    
+    with patch("app.routes.connectivity.time") as mock_time:
+        # First check, a request within the TTL and one after it expired
+        for now in (100.0, 100.0 + ttl / 2, 100.0 + ttl * 2):
+            mock_time.monotonic.return_value = now
+            response = client.get("/api/v1/verify-connectivity")
+            assert response.status_code == 200
+    
+    # Assert the database was checked again after expiry
+    assert mock_driver.verify_connectivity.await_count == 2
+
+
 def test_service_unavailable(mock_neo4j_driver):
     """Test database service unavailable error."""
     # Mock service unavailable error
     mock_driver = Mock()
-    mock_driver.verify_connectivity.side_effect = ServiceUnavailable("Service unavailable")
+    mock_driver.verify_connectivity = AsyncMock(side_effect=ServiceUnavailable("Service unavailable"))
     mock_neo4j_driver.driver.return_value = mock_driver
     
     # Make request to endpoint
@@ -62,11 +151,24 @@ def test_service_unavailable(mock_neo4j_driver):
     assert response.json()["detail"] == "Database service is unavailable"
 
 
+def test_driver_creation_error(mock_neo4j_driver):
+    """Test that an error while creating the driver is reported, not masked."""
+    # Mock driver construction failure
+    mock_neo4j_driver.driver.side_effect = ServiceUnavailable("Service unavailable")
+    
+    # Make request to endpoint
+    response = client.get("/api/v1/verify-connectivity")
+    
+    # Assert response
+    assert response.status_code == 503
+    assert response.json()["detail"] == "Database service is unavailable"
+
+
 def test_session_expired(mock_neo4j_driver):
     """Test session expired error."""
     # Mock session expired error
     mock_driver = Mock()
-    mock_driver.verify_connectivity.side_effect = SessionExpired("Session expired")
+    mock_driver.verify_connectivity = AsyncMock(side_effect=SessionExpired("Session expired"))
     mock_neo4j_driver.driver.return_value = mock_driver
     
     # Make request to endpoint
@@ -77,19 +179,34 @@ def test_session_expired(mock_neo4j_driver):
     assert response.json()["detail"] == "Database session expired"
 
 
+def test_authentication_error(mock_neo4j_driver):
+    """Test database authentication error."""
+    # Mock authentication error
+    mock_driver = Mock()
+    mock_driver.verify_connectivity = AsyncMock(side_effect=AuthError("Unauthorized"))
+    mock_neo4j_driver.driver.return_value = mock_driver
+    
+    # Make request to endpoint
+    response = client.get("/api/v1/verify-connectivity")
+    
+    # Assert response
+    assert response.status_code == 500
+    assert response.json()["detail"] == "Database authentication failed"
+
+
 def test_unexpected_error(mock_neo4j_driver):
     """Test unexpected error handling."""
     # Mock unexpected error
     mock_driver = Mock()
-    mock_driver.verify_connectivity.side_effect = Exception("Unexpected error")
+    mock_driver.verify_connectivity = AsyncMock(side_effect=Exception("Unexpected error"))
     mock_neo4j_driver.driver.return_value = mock_driver
     
     # Make request to endpoint
     response = client.get("/api/v1/verify-connectivity")
     
-    # Assert response
+    # Assert response is produced by the global exception handler
     assert response.status_code == 500
-    assert response.json()["detail"] == "Internal server error while verifying database connectivity"
+    assert response.json()["detail"] == "Internal server error"
 
 
 def test_response_model_validation():
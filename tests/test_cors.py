@@ -0,0 +1,66 @@
+"""
+Tests for cross-origin request handling.
+"""
+
+from fastapi.testclient import TestClient
+
+from app.core.config import get_settings
+from app.main import app
+
+client = TestClient(app)
+
+ALLOWED_ORIGIN = get_settings().CORS_ORIGINS[0]
+REJECTED_ORIGIN = "https://untrusted.example.com"
+
+
+def test_allowed_origin():
+    """Test that a configured origin passes preflight and simple requests."""
+    # Preflight request
+    response = client.options(
+        "/health",
+        headers={
+            "Origin": ALLOWED_ORIGIN,
+            "Access-Control-Request-Method": "GET",
+            "Access-Control-Request-Headers": "Content-Type",
+        }
+    )
+    assert response.status_code == 200
+    assert response.headers["access-control-allow-origin"] == ALLOWED_ORIGIN
+    
+    # Simple request
+    response = client.get("/health", headers={"Origin": ALLOWED_ORIGIN})
+    assert response.status_code == 200
+    assert response.headers["access-control-allow-origin"] == ALLOWED_ORIGIN
+
+
+def test_rejected_origin():
+    """Test that an unlisted origin is refused."""
+    # Preflight request
+    response = client.options(
+        "/health",
+        headers={
+            "Origin": REJECTED_ORIGIN,
+            "Access-Control-Request-Method": "GET",
+        }
+    )
+    assert response.status_code == 400
+    assert "access-control-allow-origin" not in response.headers
+    
+    # Simple request is served but without CORS headers
+    response = client.get("/health", headers={"Origin": REJECTED_ORIGIN})
+    assert response.status_code == 200
+    assert "access-control-allow-origin" not in response.headers
+
+
+def test_rejected_header():
+    """Test that preflight requests for unlisted headers are refused."""
+    response = client.options(
+        "/health",
+        headers={
+            "Origin": ALLOWED_ORIGIN,
+            "Access-Control-Request-Method": "GET",
+            "Access-Control-Request-Headers": "X-Custom-Header",
+        }
+    )
+    assert response.status_code == 400
+    assert response.text == "Disallowed CORS headers"
\ No newline at end of file
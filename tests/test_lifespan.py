@@ -0,0 +1,105 @@
+"""
+Tests for application startup and shutdown.
+"""
+
+import json
+
+import pytest
+from unittest.mock import AsyncMock, Mock, patch
+from fastapi.testclient import TestClient
+
+from app.core.config import get_settings
+from app.db.neo4j_utils import Neo4jConnection
+from app.main import app
+
+
+class FakeSession:
+    """Async session recording the statements it runs."""
+
+    def __init__(self, statements):
+        self.statements = statements
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return None
+
+    async def run(self, statement):
+        result = Mock()
+        result.consume = AsyncMock(side_effect=lambda: self.statements.append(statement))
+        return result
+
+
+@pytest.fixture
+def mock_neo4j_driver():
+    """Fixture to mock the Neo4j driver created by the lifespan."""
+    Neo4jConnection._driver = None
+    mock_driver = Mock()
+    mock_driver.verify_connectivity = AsyncMock(return_value=None)
+    mock_driver.close = AsyncMock(return_value=None)
+    # Statements are recorded once their result has been consumed
+    mock_driver.statements = []
+    mock_driver.session.side_effect = lambda **kwargs: FakeSession(mock_driver.statements)
+    with patch("app.db.neo4j_utils.AsyncGraphDatabase") as mock_graph_db:
+        mock_graph_db.driver.return_value = mock_driver
+        yield mock_driver
+    Neo4jConnection._driver = None
+
+
+@pytest.fixture
+def settings_env(monkeypatch):
+    """Fixture to load settings from patched environment variables."""
+    get_settings.cache_clear()
+    yield monkeypatch
+    get_settings.cache_clear()
+
+
+def test_lifespan_warms_up_pool(mock_neo4j_driver, settings_env):
+    """Test that startup opens NEO4J_POOL_WARMUP connections and shutdown closes the driver."""
+    settings_env.setenv("NEO4J_POOL_WARMUP", "3")
+
+    with TestClient(app):
+        assert mock_neo4j_driver.statements == ["RETURN 1"] * 3
+        mock_neo4j_driver.close.assert_not_awaited()
+
+    mock_neo4j_driver.verify_connectivity.assert_awaited_once()
+    mock_neo4j_driver.close.assert_awaited_once()
+    assert Neo4jConnection._driver is None
+
+
+def test_lifespan_warmup_capped_at_pool_size(mock_neo4j_driver, settings_env):
+    """Test that the warmup never opens more connections than the pool holds."""
+    settings_env.setenv("NEO4J_POOL_WARMUP", "8")
+    settings_env.setenv("NEO4J_MAX_POOL_SIZE", "2")
+
+    with TestClient(app):
+        assert mock_neo4j_driver.statements == ["RETURN 1"] * 2
+
+    mock_neo4j_driver.close.assert_awaited_once()
+
+def test_lifespan_creates_startup_indexes(mock_neo4j_driver, settings_env):
+    """Test that each NEO4J_STARTUP_INDEXES statement is run and consumed at startup."""
+    statements = [
+        "CREATE INDEX entity_id_idx IF NOT EXISTS FOR (n:Entity) ON (n.id)",
+        "CREATE INDEX entity_name_idx IF NOT EXISTS FOR (n:Entity) ON (n.name)",
+    ]
+    settings_env.setenv("NEO4J_STARTUP_INDEXES", json.dumps(statements))
+    settings_env.setenv("NEO4J_POOL_WARMUP", "0")
+
+    with TestClient(app):
+        assert mock_neo4j_driver.statements == statements
+
+    # All indexes are created in a single session
+    mock_neo4j_driver.session.assert_called_once()
+
+
+def test_lifespan_without_startup_indexes(mock_neo4j_driver, settings_env):
+    """Test that no session is opened when there are no indexes to create."""
+    settings_env.setenv("NEO4J_STARTUP_INDEXES", "[]")
+    settings_env.setenv("NEO4J_POOL_WARMUP", "0")
+
+    with TestClient(app):
+        pass
+
+    mock_neo4j_driver.session.assert_not_called()
\ No newline at end of file
@@ -0,0 +1,279 @@
+"""
+Tests for Neo4j database utilities.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+from neo4j import AsyncSession
+from neo4j.exceptions import ServiceUnavailable
+
+from app.db.neo4j_utils import (
+    execute_batch,
+    execute_query_paged,
+    get_neo4j_session,
+    prefetch_pages,
+    run_read,
+    run_write,
+)
+
+
+class FakeResult:
+    """Async iterable standing in for a Neo4j result."""
+
+    def __init__(self, records):
+        self._records = records
+
+    async def __aiter__(self):
+        for record in self._records:
+            yield record
+
+
+class FakeSession:
+    """Session serving the integers 0..total-1 through SKIP/LIMIT queries."""
+
+    def __init__(self, total, fail_on_call=None):
+        self.total = total
+        self.fail_on_call = fail_on_call
+        self.calls = []
+
+    async def run(self, query, params):
+        self.calls.append((query, params))
+        if len(self.calls) == self.fail_on_call:
+            raise ServiceUnavailable("Service unavailable")
+        skip, limit = params["_skip"], params["_limit"]
+        return FakeResult(list(range(self.total))[skip:skip + limit])
+
+
+async def collect(items):
+    """Collect the items yielded by an async iterator."""
+    return [item async for item in items]
+
+
+def test_session_is_shared_within_request():
+    """Test that one session is reused within a request and closed afterwards."""
+    # Mock driver handing out a new session per call
+    mock_driver = Mock()
+    mock_driver.session.side_effect = lambda **kwargs: Mock(close=AsyncMock())
+
+    test_app = FastAPI()
+    test_app.state.neo4j_driver = mock_driver
+    seen = {}
+
+    @test_app.get("/sessions")
+    async def use_sessions(
+        first: AsyncSession = Depends(get_neo4j_session),
+        # Bypass FastAPI's dependency cache to exercise request.state reuse
+        second: AsyncSession = Depends(get_neo4j_session, use_cache=False)
+    ) -> dict:
+        seen["first"] = first
+        seen["second"] = second
+        seen["closed_during_request"] = first.close.await_count
+        return {}
+
+    # Make request to endpoint
+    response = TestClient(test_app).get("/sessions")
+
+    # Assert a single session was opened, shared and closed after the handler
+    assert response.status_code == 200
+    mock_driver.session.assert_called_once()
+    assert seen["first"] is seen["second"]
+    assert seen["closed_during_request"] == 0
+    seen["first"].close.assert_awaited_once()
+
+
+def make_managed_session(records):
+    """Create a mock session whose managed transactions return records."""
+    tx = Mock()
+    tx.run = AsyncMock(return_value=FakeResult(records))
+
+    async def execute(work, *args):
+        return await work(tx, *args)
+
+    session = Mock()
+    session.execute_read = AsyncMock(side_effect=execute)
+    session.execute_write = AsyncMock(side_effect=execute)
+    return session, tx
+
+
+@pytest.mark.asyncio
+async def test_run_read_uses_managed_read_transaction():
+    """Test that run_read goes through execute_read and collects records."""
+    session, tx = make_managed_session(["a", "b"])
+
+    records = await run_read(session, "MATCH (n) RETURN n", {"id": 1})
+
+    assert records == ["a", "b"]
+    session.execute_read.assert_awaited_once()
+    session.execute_write.assert_not_awaited()
+    tx.run.assert_awaited_once_with("MATCH (n) RETURN n", {"id": 1})
+
+
+@pytest.mark.asyncio
+async def test_run_write_uses_managed_write_transaction():
+    """Test that run_write goes through execute_write and collects records."""
+    session, tx = make_managed_session(["a"])
+
+    records = await run_write(session, "MERGE (n:Entity {id: 1}) RETURN n")
+
+    assert records == ["a"]
+    session.execute_write.assert_awaited_once()
+    session.execute_read.assert_not_awaited()
+    tx.run.assert_awaited_once_with("MERGE (n:Entity {id: 1}) RETURN n", {})
+
+
+def make_batch_tx():
+    """Create a mock transaction whose results can be consumed."""
+    tx = Mock()
+    tx.run = AsyncMock(return_value=Mock(consume=AsyncMock(return_value="summary")))
+    return tx
+
+
+@pytest.mark.asyncio
+async def test_execute_batch_chunks_rows():
+    """Test that rows are sent as slices of at most chunk_size."""
+    tx = make_batch_tx()
+    rows = [{"id": i} for i in range(5)]
+    query = "UNWIND $rows AS r MERGE (n:Entity {id: r.id})"
+
+    summaries = await execute_batch(tx, query, rows, chunk_size=2)
+
+    assert [call.kwargs["rows"] for call in tx.run.await_args_list] == [
+        rows[0:2], rows[2:4], rows[4:5]
+    ]
+    assert all(call.args == (query,) for call in tx.run.await_args_list)
+    assert summaries == ["summary"] * 3
+
+
+@pytest.mark.asyncio
+async def test_execute_batch_empty_rows():
+    """Test that no query is sent for an empty batch."""
+    tx = make_batch_tx()
+
+    summaries = await execute_batch(tx, "UNWIND $rows AS r RETURN r", [])
+
+    assert summaries == []
+    tx.run.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_execute_batch_invalid_chunk_size():
+    """Test that a non-positive chunk size is rejected."""
+    tx = make_batch_tx()
+
+    with pytest.raises(ValueError):
+        await execute_batch(tx, "UNWIND $rows AS r RETURN r", [{"id": 1}], chunk_size=0)
+    tx.run.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_execute_query_paged_params():
+    """Test that each page is fetched with SKIP/LIMIT parameters."""
+    session = FakeSession(total=5)
+
+    records = await collect(execute_query_paged(
+        session, "MATCH (n) RETURN n", {"label": "Entity"}, page_size=2
+    ))
+
+    # Stops after the short third page
+    assert records == [0, 1, 2, 3, 4]
+    assert [params for _, params in session.calls] == [
+        {"label": "Entity", "_skip": 0, "_limit": 2},
+        {"label": "Entity", "_skip": 2, "_limit": 2},
+        {"label": "Entity", "_skip": 4, "_limit": 2},
+    ]
+    assert all(
+        query == "MATCH (n) RETURN n SKIP $_skip LIMIT $_limit"
+        for query, _ in session.calls
+    )
+
+
+@pytest.mark.asyncio
+async def test_execute_query_paged_exact_multiple():
+    """Test that an extra, empty page is fetched when pages divide the total."""
+    session = FakeSession(total=4)
+
+    records = await collect(execute_query_paged(session, "MATCH (n) RETURN n", page_size=2))
+
+    assert records == [0, 1, 2, 3]
+    assert len(session.calls) == 3
+
+
+@pytest.mark.asyncio
+async def test_execute_query_paged_invalid_page_size():
+    """Test that a non-positive page size is rejected."""
+    session = FakeSession(total=4)
+
+    with pytest.raises(ValueError):
+        await collect(execute_query_paged(session, "MATCH (n) RETURN n", page_size=0))
+    assert session.calls == []
+
+
+@pytest.mark.asyncio
+async def test_prefetch_pages_in_order():
+    """Test that pages are yielded in order, ending with the short page."""
+    session = FakeSession(total=7)
+
+    pages = await collect(prefetch_pages(session, "MATCH (n) RETURN n", page_size=3))
+
+    assert pages == [[0, 1, 2], [3, 4, 5], [6]]
+    assert len(session.calls) == 3
+
+
+@pytest.mark.asyncio
+async def test_prefetch_pages_empty_result():
+    """Test that an empty result yields no pages."""
+    session = FakeSession(total=0)
+
+    pages = await collect(prefetch_pages(session, "MATCH (n) RETURN n", page_size=3))
+
+    assert pages == []
+    assert len(session.calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_prefetch_pages_reraises_errors():
+    """Test that an error while fetching is raised in the consumer."""
+    session = FakeSession(total=10, fail_on_call=2)
+    pages = []
+
+    with pytest.raises(ServiceUnavailable):
+        async for page in prefetch_pages(session, "MATCH (n) RETURN n", page_size=3):
+            pages.append(page)
+
+    # Pages fetched before the error are still delivered
+    assert pages == [[0, 1, 2]]
+
+
+@pytest.mark.asyncio
+async def test_prefetch_pages_cleanup_after_break():
+    """Test that the producer task is cancelled when iteration stops early."""
+    session = FakeSession(total=100)
+    pages = prefetch_pages(session, "MATCH (n) RETURN n", page_size=1)
+
+    async for _ in pages:
+        break
+    await pages.aclose()
+
+    # No producer task is left running
+    pending = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+    assert pending == []
+
+
+@pytest.mark.asyncio
+async def test_prefetch_pages_bounds_read_ahead():
+    """Test that at most ``prefetch`` pages are buffered ahead of the consumer."""
+    session = FakeSession(total=100)
+    pages = prefetch_pages(session, "MATCH (n) RETURN n", page_size=1, prefetch=2)
+
+    await pages.__anext__()
+    # Let the producer run as far ahead as it can
+    for _ in range(20):
+        await asyncio.sleep(0)
+
+    # One page consumed, two buffered and one fetched page waiting for space
+    assert len(session.calls) == 4
+    await pages.aclose()
\ No newline at end of file